@@ -17,18 +17,17 @@ Usage:
 """
 
 import asyncio
+import importlib
 import os
 import sys
+import time
 from pathlib import Path
 import argparse
-from datetime import datetime
 
-# Import optimized modules
+# Import optimized modules (the agent SDK, git and Linear integration modules
+# are imported inside run_optimized_autonomous_agent so --help stays fast)
 from linear_cache import LinearCache
 from logging_system import create_logger
-from linear_enhanced import create_enhanced_integration
-from git_utils import create_git_manager
-from agent import run_agent_session
 from prompts import get_initializer_prompt, get_coding_prompt
 
 # Load environment variables
@@ -39,6 +38,15 @@ except ImportError:
     pass
 
 
+# Delay between sessions: none after a healthy session, exponential backoff
+# (in seconds) after errors or under heavy Linear API usage
+BASE_SESSION_DELAY_SECONDS = 3
+MAX_SESSION_DELAY_SECONDS = 30
+
+# How long to wait for a background push before moving on without it
+PUSH_TIMEOUT_SECONDS = 120
+
+
 def validate_environment():
     """Validate required environment variables."""
     oauth_token = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
@@ -57,20 +65,75 @@ def validate_environment():
     print("✅ Environment variables validated")
 
 
+# Client factory per security mode: (module, factory, banner). Modules are
+# imported on first use so standard mode never loads security_yolo.
+_CLIENT_FACTORIES = {
+    'yolo': ('security_yolo', 'create_yolo_client',
+             "🚀 Using YOLO security mode (unrestricted commands)"),
+    'ultra-yolo': ('security_yolo', 'create_ultra_yolo_client',
+                   "💀 Using ULTRA YOLO security mode (no sandbox!)"),
+    'standard': ('client', 'create_client',
+                 "🔒 Using standard security mode (allowlist)"),
+}
+
+# Factories already imported, keyed by security mode
+_resolved_factories = {}
+
+
 def create_client_with_mode(project_dir: Path, model: str, security_mode: str):
     """Create client based on security mode."""
-    if security_mode == 'yolo':
-        from security_yolo import create_yolo_client
-        print("🚀 Using YOLO security mode (unrestricted commands)")
-        return create_yolo_client(project_dir, model)
-    elif security_mode == 'ultra-yolo':
-        from security_yolo import create_ultra_yolo_client
-        print("💀 Using ULTRA YOLO security mode (no sandbox!)")
-        return create_ultra_yolo_client(project_dir, model)
+    if security_mode not in _CLIENT_FACTORIES:
+        security_mode = 'standard'
+    module_name, factory_name, banner = _CLIENT_FACTORIES[security_mode]
+
+    factory = _resolved_factories.get(security_mode)
+    if factory is None:
+        factory = getattr(importlib.import_module(module_name), factory_name)
+        _resolved_factories[security_mode] = factory
+
+    print(banner)
+    return factory(project_dir, model)
+
+
+def get_session_delay(consecutive_errors: int, api_stats: dict) -> int:
+    """Seconds to wait before the next session."""
+    if consecutive_errors == 0 and api_stats['percentage_used'] < 50:
+        return 0
+    return min(BASE_SESSION_DELAY_SECONDS * 2 ** consecutive_errors, MAX_SESSION_DELAY_SECONDS)
+
+
+def start_push(git_mgr) -> asyncio.Task:
+    """Push committed changes in a background thread."""
+    print("📤 Pushing changes in background...")
+    return asyncio.create_task(asyncio.to_thread(git_mgr.push))
+
+
+async def report_push(push_task: asyncio.Task, timeout: float = PUSH_TIMEOUT_SECONDS) -> bool:
+    """
+    Wait for a background push and print its outcome.
+
+    The push is never cancelled: on timeout its thread keeps running and
+    False is returned, so the caller can hold off starting another push.
+    """
+    done, _ = await asyncio.wait({push_task}, timeout=timeout)
+    if not done:
+        print(f"⚠️  Git push: still running after {timeout} seconds\n")
+        return False
+
+    try:
+        push_success, push_msg = push_task.result()
+    except Exception as e:
+        print(f"⚠️  Git push failed: {e}\n")
+        return True
+
+    if push_success:
+        print(f"✅ {push_msg}\n")
     else:
-        from client import create_client
-        print("🔒 Using standard security mode (allowlist)")
-        return create_client(project_dir, model)
+        print(f"⚠️  Git push: {push_msg}\n")
+        if "Authentication required" in push_msg:
+            print("   💡 Tip: Run 'gh auth login' or set up SSH keys")
+            print("   💡 Or disable auto-push with --no-push flag\n")
+    return True
 
 
 async def run_optimized_autonomous_agent(
@@ -92,6 +155,10 @@ async def run_optimized_autonomous_agent(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         auto_push: Automatically commit and push after each session (default: True)
     """
+    from linear_enhanced import create_enhanced_integration
+    from git_utils import create_git_manager
+    from agent import run_agent_session
+
     # Ensure absolute path
     project_dir = project_dir.resolve()
     project_dir.mkdir(parents=True, exist_ok=True)
@@ -105,16 +172,18 @@ async def run_optimized_autonomous_agent(
     linear_marker = project_dir / ".linear_project.json"
     is_first_run = not linear_marker.exists()
 
-    # Print startup banner
-    print("\n" + "="*70)
-    print("  OPTIMIZED LINEAR CODING AGENT")
-    print("="*70)
-    print(f"  Project: {project_dir.name}")
-    print(f"  Model: {model}")
-    print(f"  Security: {security_mode}")
-    print(f"  Mode: {'Initializer (first run)' if is_first_run else 'Coding agent'}")
-    print(f"  Optimizations: Caching ✓ | Enhanced Linear ✓ | Structured Logging ✓")
-    print("="*70 + "\n")
+    # Print startup banner (single write)
+    print("\n".join([
+        "\n" + "="*70,
+        "  OPTIMIZED LINEAR CODING AGENT",
+        "="*70,
+        f"  Project: {project_dir.name}",
+        f"  Model: {model}",
+        f"  Security: {security_mode}",
+        f"  Mode: {'Initializer (first run)' if is_first_run else 'Coding agent'}",
+        f"  Optimizations: Caching ✓ | Enhanced Linear ✓ | Structured Logging ✓",
+        "="*70 + "\n",
+    ]))
 
     # Display initial progress if not first run
     if not is_first_run:
@@ -122,6 +191,9 @@ async def run_optimized_autonomous_agent(
         print()
 
     iteration = 0
+    consecutive_errors = 0
+    pending_push = None
+    needs_push = False
     while True:
         iteration += 1
 
@@ -130,7 +202,7 @@ async def run_optimized_autonomous_agent(
             break
 
         # Generate session ID
-        session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{iteration:03d}"
+        session_id = f"session_{time.strftime('%Y%m%d_%H%M%S')}_{iteration:03d}"
         agent_type = "initializer" if is_first_run else "coding"
 
         # Create logger for this session
@@ -178,38 +250,50 @@ async def run_optimized_autonomous_agent(
                 issues_attempted=1
             )
 
-            # Print session summary
+            # Print session summary (single write)
             summary = logger.get_session_summary()
-            print(f"\n{'='*70}")
-            print(f"  SESSION COMPLETE")
-            print(f"{'='*70}")
-            print(f"  Duration: {summary['metrics']['duration_minutes']} minutes")
-            print(f"  Linear API Calls: {summary['metrics']['linear_api_calls']}")
-            print(f"  Cached Calls: {summary['metrics']['linear_api_cached']}")
-            print(f"  Errors: {summary['metrics']['errors']}")
-            print(f"\n  Log Files:")
-            print(f"    - Session: {summary['log_files']['session']}")
-            print(f"    - Daily: {summary['log_files']['daily']}")
-            print(f"    - Errors: {summary['log_files']['errors']}")
-            print(f"{'='*70}\n")
-
-            # Auto-commit and push if enabled
+            metrics = summary['metrics']
+            log_files = summary['log_files']
+            print("\n".join([
+                f"\n{'='*70}",
+                f"  SESSION COMPLETE",
+                f"{'='*70}",
+                f"  Duration: {metrics['duration_minutes']} minutes",
+                f"  Linear API Calls: {metrics['linear_api_calls']}",
+                f"  Cached Calls: {metrics['linear_api_cached']}",
+                f"  Errors: {metrics['errors']}",
+                f"\n  Log Files:",
+                f"    - Session: {log_files['session']}",
+                f"    - Daily: {log_files['daily']}",
+                f"    - Errors: {log_files['errors']}",
+                f"{'='*70}\n",
+            ]))
+
+            # Auto-commit and push if enabled. The commit is local and runs
+            # now, before the next session edits files; the push runs in
+            # background, one at a time (commits made meanwhile go with the next)
             if auto_push:
-                print("📝 Committing and pushing changes...")
-                commit_success, commit_msg = git_mgr.commit_and_push(
+                print("📝 Committing changes...")
+                commit_success, commit_msg = git_mgr.commit(
                     issues_completed=[],  # TODO: Track from Linear
                     issues_attempted=[],
                     session_metrics=logger.metrics,
                     session_id=session_id
                 )
-
-                if commit_success:
-                    print(f"✅ {commit_msg}\n")
-                else:
+                if not commit_success:
                     print(f"⚠️  Git operation: {commit_msg}\n")
-                    if "Authentication required" in commit_msg:
-                        print("   💡 Tip: Run 'gh auth login' or set up SSH keys")
-                        print("   💡 Or disable auto-push with --no-push flag\n")
+                elif commit_msg != "No changes to commit":
+                    needs_push = True
+
+                if needs_push:
+                    if pending_push and pending_push.done():
+                        await report_push(pending_push)
+                        pending_push = None
+                    if pending_push is None:
+                        pending_push = start_push(git_mgr)
+                        needs_push = False
+                    else:
+                        print("📤 Previous push still running; will push this commit after it\n")
 
             # Check API usage
             api_stats = cache.get_api_stats()
@@ -230,14 +314,23 @@ async def run_optimized_autonomous_agent(
                 print(f"✅ Session completed successfully.\n")
 
         except Exception as e:
+            status = "error"
             logger.log_error("session_error", str(e))
             print(f"❌ Error during session: {e}")
             print(f"   Retrying with fresh context...\n")
 
-        # Auto-continue with delay (3 seconds)
+        consecutive_errors = consecutive_errors + 1 if status == "error" else 0
+
+        # Auto-continue, backing off after errors or heavy API usage
         if max_iterations is None or iteration < max_iterations:
-            print(f"⏸️  Waiting 3 seconds before next session...\n")
-            await asyncio.sleep(3)
+            delay = get_session_delay(consecutive_errors, cache.get_api_stats())
+            if delay:
+                print(f"⏸️  Waiting {delay} seconds before next session...\n")
+                await asyncio.sleep(delay)
+
+    # Wait for the last push, then push any commits made while it ran
+    if pending_push and await report_push(pending_push) and needs_push:
+        await report_push(start_push(git_mgr))
 
     # Final summary
     print("\n" + "="*70)
@@ -11,12 +11,58 @@ Key Features:
 - Rate limit tracking and warnings
 """
 
+import asyncio
+import atexit
 import json
+import os
 import time
+import weakref
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
+# orjson is much faster for the large issue dicts; fall back to stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+# Linear API rate limit (requests per hour) and warning threshold (80%)
+RATE_LIMIT_PER_HOUR = 1500
+RATE_LIMIT_WARNING = 1200
+RATE_LIMIT_WINDOW_SECONDS = 3600
+
+# Session issue lists are fresh for 5 minutes, then served stale (while a
+# background refresh runs) for up to 15 minutes before becoming a hard miss
+SESSION_TTL_SECONDS = 300
+STALE_TTL_SECONDS = 900
+
+# Maximum concurrent Linear API requests when fetching issues in batch
+MAX_CONCURRENT_FETCHES = 10
+
+# Issue updates sent per batched Linear API call, and max updates queued
+MAX_UPDATE_BATCH = 16
+MAX_PENDING_UPDATES = 100
+
+# Caches with possibly unsaved changes, flushed at interpreter exit. Held
+# weakly so a cache that is no longer used can still be garbage collected.
+_open_caches: "weakref.WeakSet[LinearCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches():
+    for cache in list(_open_caches):
+        cache.flush()
+
 
 class LinearCache:
     """
@@ -28,58 +74,96 @@ class LinearCache:
     3. SHORT-TERM: Team/project metadata (5min TTL)
     """
 
+    __slots__ = (
+        'project_dir', 'cache_file', 'session_cache', 'api_call_count',
+        'api_call_timestamps', 'permanent_cache', 'metadata_cache', '_dirty',
+        '_session_generations', '__weakref__'
+    )
+
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir
         self.cache_file = project_dir / ".linear_cache.json"
         self.session_cache: Dict[str, Any] = {}
+        # Bumped on every invalidation so fetches started earlier are dropped
+        self._session_generations: Dict[str, int] = {}
         self.api_call_count = 0
-        self.api_call_timestamps: List[float] = []
+        self.api_call_timestamps: Deque[float] = deque()
+        self._dirty = False
         self.load_cache()
 
+        # Persist any unsaved issues when the process exits
+        _open_caches.add(self)
+
+    def __del__(self):
+        self.flush()
+
     def load_cache(self):
         """Load persistent cache from disk."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    data = json.load(f)
-                    self.permanent_cache = data.get('permanent', {})
-                    self.metadata_cache = data.get('metadata', {})
-                    print(f"📦 Loaded cache with {len(self.permanent_cache.get('issues', {}))} cached issues")
-            except Exception as e:
-                print(f"⚠️  Failed to load cache: {e}")
-                self.permanent_cache = {'issues': {}}
-                self.metadata_cache = {}
-        else:
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = _loads(f.read())
+            self.permanent_cache = data.get('permanent', {'issues': {}})
+            self.metadata_cache = data.get('metadata', {})
+            print(f"📦 Loaded cache with {len(self.permanent_cache.get('issues', {}))} cached issues")
+        except FileNotFoundError:
+            self.permanent_cache = {'issues': {}}
+            self.metadata_cache = {}
+        except Exception as e:
+            print(f"⚠️  Failed to load cache: {e}")
             self.permanent_cache = {'issues': {}}
             self.metadata_cache = {}
 
     def save_cache(self):
-        """Save persistent cache to disk."""
+        """
+        Save persistent cache to disk.
+        Writes and fsyncs a temp file, then atomically replaces the cache,
+        so a crash never leaves a truncated cache. Always indented: agents
+        and the guides grep this file line by line.
+        """
+        tmp_file = self.cache_file.with_suffix('.json.tmp')
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump({
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps({
                     'permanent': self.permanent_cache,
                     'metadata': self.metadata_cache,
                     'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
+                }))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
         except Exception as e:
             print(f"⚠️  Failed to save cache: {e}")
 
+    def flush(self):
+        """Save cache to disk if there are unsaved changes."""
+        if self._dirty:
+            self.save_cache()
+
+    def close(self):
+        """Flush the cache and stop tracking it for the exit-time flush."""
+        self.flush()
+        _open_caches.discard(self)
+
     def track_api_call(self):
         """Track API calls for rate limit monitoring."""
-        now = time.time()
+        # Monotonic clock, so the deque stays sorted even if wall time jumps back
+        now = time.monotonic()
+        timestamps = self.api_call_timestamps
         self.api_call_count += 1
-        self.api_call_timestamps.append(now)
+        timestamps.append(now)
 
-        # Clean up old timestamps (older than 1 hour)
-        one_hour_ago = now - 3600
-        self.api_call_timestamps = [t for t in self.api_call_timestamps if t > one_hour_ago]
+        # Drop old timestamps (older than 1 hour); they are in insertion order
+        window_start = now - RATE_LIMIT_WINDOW_SECONDS
+        while timestamps[0] <= window_start:
+            timestamps.popleft()
 
         # Warn if approaching rate limit
-        if len(self.api_call_timestamps) > 1200:  # 80% of 1500/hr
-            print(f"⚠️  WARNING: {len(self.api_call_timestamps)} API calls in last hour (limit: 1500)")
+        calls_last_hour = len(timestamps)
+        if calls_last_hour > RATE_LIMIT_WARNING:
+            print(f"⚠️  WARNING: {calls_last_hour} API calls in last hour (limit: {RATE_LIMIT_PER_HOUR})")
 
-        return len(self.api_call_timestamps)
+        return calls_last_hour
 
     def get_cached_issue(self, issue_id: str) -> Optional[Dict]:
         """
@@ -92,6 +176,7 @@ class LinearCache:
         """
         Cache issue data permanently.
         Only caches immutable fields (description, title).
+        Changes are kept in memory until flush() is called.
         """
         if issue_id not in self.permanent_cache['issues']:
             self.permanent_cache['issues'][issue_id] = {
@@ -101,40 +186,87 @@ class LinearCache:
                 'priority': issue_data.get('priority'),
                 'cached_at': datetime.now().isoformat()
             }
-            self.save_cache()
+            self._dirty = True
 
-    def get_session_issues(self, project_id: str) -> Optional[List[Dict]]:
+    def get_session_issues(
+        self,
+        project_id: str,
+        status: Optional[str] = None
+    ) -> Tuple[Optional[List[Dict]], bool]:
         """
         Get all issues for a project from session cache.
         This cache is invalidated when any issue is updated.
+
+        If status is given, only issues in that state are returned.
+
+        Returns (issues, is_stale). Stale lists are still returned so the
+        caller can serve them immediately and refresh in the background.
         """
         cache_key = f"issues_{project_id}"
         cached_data = self.session_cache.get(cache_key)
 
         if cached_data:
-            # Check if cache is still fresh (< 5 minutes)
-            cached_time = cached_data.get('timestamp', 0)
-            if time.time() - cached_time < 300:  # 5 minutes
-                print(f"✅ Using cached issue list ({len(cached_data['issues'])} issues)")
-                return cached_data['issues']
+            age = time.time() - cached_data.get('timestamp', 0)
+            if age < STALE_TTL_SECONDS:
+                is_stale = age >= SESSION_TTL_SECONDS
+                if is_stale:
+                    print(f"♻️  Using stale issue list ({len(cached_data['issues'])} issues), refreshing")
+                else:
+                    print(f"✅ Using cached issue list ({len(cached_data['issues'])} issues)")
+
+                if status:
+                    return cached_data['by_status'].get(status, []), is_stale
+                return cached_data['issues'], is_stale
+
+        return None, False
+
+    def session_generation(self, project_id: str) -> int:
+        """Current generation of a project's session cache (see invalidate_session_cache)."""
+        return self._session_generations.get(project_id, 0)
+
+    def cache_session_issues(
+        self,
+        project_id: str,
+        issues: List[Dict],
+        generation: Optional[int] = None
+    ):
+        """
+        Cache issue list for current session.
 
-        return None
+        If generation is given (from session_generation() before the fetch)
+        and the cache was invalidated since, the list is out of date and is
+        not cached for the session.
+        """
+        if generation is not None and generation != self.session_generation(project_id):
+            print("🔄 Discarding issue list fetched before the last update")
+            self._cache_issues(issues)
+            return
+
+        # Index by state name so status-filtered lookups skip the scan
+        by_status: Dict[str, List[Dict]] = {}
+        for issue in issues:
+            by_status.setdefault(issue.get('state', {}).get('name'), []).append(issue)
 
-    def cache_session_issues(self, project_id: str, issues: List[Dict]):
-        """Cache issue list for current session."""
         cache_key = f"issues_{project_id}"
         self.session_cache[cache_key] = {
             'issues': issues,
+            'by_status': by_status,
             'timestamp': time.time()
         }
 
-        # Also cache individual issue descriptions
+        self._cache_issues(issues)
+
+    def _cache_issues(self, issues: List[Dict]):
+        """Cache individual issue descriptions (single save for the batch)."""
         for issue in issues:
             if issue.get('id'):
                 self.cache_issue(issue['id'], issue)
 
+        self.flush()
+
     def invalidate_session_cache(self, project_id: str):
         """Invalidate session cache after updates."""
+        self._session_generations[project_id] = self.session_generation(project_id) + 1
         cache_key = f"issues_{project_id}"
         if cache_key in self.session_cache:
             del self.session_cache[cache_key]
@@ -146,8 +278,8 @@ class LinearCache:
         return {
             'total_calls_session': self.api_call_count,
             'calls_last_hour': calls_last_hour,
-            'rate_limit': 1500,
-            'percentage_used': (calls_last_hour / 1500) * 100,
+            'rate_limit': RATE_LIMIT_PER_HOUR,
+            'percentage_used': (calls_last_hour / RATE_LIMIT_PER_HOUR) * 100,
             'cached_issues': len(self.permanent_cache['issues'])
         }
 
@@ -165,30 +297,64 @@ class CachedLinearClient:
         issue = await client.get_issue(issue_id)
     """
 
+    __slots__ = (
+        'cache', 'prefix', '_refresh_tasks', '_fetch_semaphore',
+        '_update_queue', '_update_worker', '_failed_updates'
+    )
+
     def __init__(self, cache: LinearCache, linear_tools_prefix: str = "mcp__linear__"):
         self.cache = cache
         self.prefix = linear_tools_prefix
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._update_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_UPDATES)
+        self._update_worker: Optional[asyncio.Task] = None
+        self._failed_updates: List[Tuple[List[str], Exception]] = []
 
     async def list_issues(self, agent_client, project_id: str, status: Optional[str] = None) -> List[Dict]:
         """
         List issues with caching.
 
         Strategy:
-        1. Check session cache first
+        1. Check session cache first (stale lists are refreshed in background)
         2. If miss, call Linear API
         3. Cache results for session
         4. Merge with permanent cache for descriptions
         """
-        # Check session cache
-        cached_issues = self.cache.get_session_issues(project_id)
-        if cached_issues:
-            # Filter by status if requested
-            if status:
-                return [i for i in cached_issues if i.get('state', {}).get('name') == status]
+        # Check session cache (filtered by status if requested)
+        cached_issues, is_stale = self.cache.get_session_issues(project_id, status)
+        if cached_issues is not None:
+            if is_stale:
+                self._schedule_refresh(agent_client, project_id)
             return cached_issues
 
         # Cache miss - call API
         print(f"📡 Fetching issues from Linear API (cache miss)")
+        return await self._fetch_issues(agent_client, project_id)
+
+    def _schedule_refresh(self, agent_client, project_id: str):
+        """Start a background refresh of a stale issue list (one per project)."""
+        task = self._refresh_tasks.get(project_id)
+        if task and not task.done():
+            return
+
+        self._refresh_tasks[project_id] = asyncio.create_task(
+            self._refresh(agent_client, project_id)
+        )
+
+    async def _refresh(self, agent_client, project_id: str):
+        """Re-fetch issue list and swap it into the session cache."""
+        try:
+            await self._fetch_issues(agent_client, project_id)
+        except Exception as e:
+            # The stale list keeps being served; the next stale hit retries
+            print(f"⚠️  Failed to refresh issue list: {e}")
+        finally:
+            self._refresh_tasks.pop(project_id, None)
+
+    async def _fetch_issues(self, agent_client, project_id: str) -> List[Dict]:
+        """Fetch issue list from Linear API and cache it for the session."""
+        generation = self.cache.session_generation(project_id)
         self.cache.track_api_call()
 
         # Note: This is a simplified example. In real implementation, you'd need to
@@ -196,7 +362,7 @@ class CachedLinearClient:
         # For now, this serves as the integration point.
 
         # After getting issues from Linear:
-        # self.cache.cache_session_issues(project_id, issues)
+        # self.cache.cache_session_issues(project_id, issues, generation)
 
         return []  # Placeholder
 
@@ -213,22 +379,118 @@ class CachedLinearClient:
             return cached
 
         # Cache miss - call API
-        print(f"📡 Fetching issue {issue_id} from Linear API")
-        self.cache.track_api_call()
+        return await self._fetch_issue(agent_client, issue_id)
+
+    async def get_issues(self, agent_client, issue_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get several issues with caching.
+
+        Cached issues are returned directly; misses are fetched concurrently
+        (at most MAX_CONCURRENT_FETCHES at a time) and cached in one save.
+        """
+        issues: Dict[str, Optional[Dict]] = {}
+        misses = []
+        for issue_id in issue_ids:
+            cached = self.cache.get_cached_issue(issue_id)
+            if cached:
+                issues[issue_id] = cached
+            else:
+                misses.append(issue_id)
+
+        if misses:
+            print(f"📡 Fetching {len(misses)} issues from Linear API ({len(issues)} cached)")
+            results = await asyncio.gather(
+                *(self._fetch_issue(agent_client, issue_id) for issue_id in misses)
+            )
+            for issue_id, issue in zip(misses, results):
+                issues[issue_id] = issue
+                if issue:
+                    self.cache.cache_issue(issue_id, issue)
+            self.cache.flush()
+
+        return issues
+
+    async def _fetch_issue(self, agent_client, issue_id: str) -> Optional[Dict]:
+        """Fetch single issue from Linear API."""
+        async with self._fetch_semaphore:
+            print(f"📡 Fetching issue {issue_id} from Linear API")
+            self.cache.track_api_call()
+
+            # Placeholder for actual API call
+            return None
+
+    async def update_issue(
+        self,
+        agent_client,
+        issue_id: str,
+        project_id: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Queue issue update.
 
-        # Placeholder for actual API call
-        return None
+        Updates are sent to Linear in batches by a background task, and the
+        session cache is invalidated once per batch. Call drain_updates()
+        before relying on the updates being applied.
+        """
+        if self._update_worker is None or self._update_worker.done():
+            self._update_worker = asyncio.create_task(self._process_updates())
+
+        await self._update_queue.put((agent_client, issue_id, project_id, kwargs))
 
-    async def update_issue(self, agent_client, issue_id: str, **kwargs):
+    async def drain_updates(self):
         """
-        Update issue and invalidate session cache.
+        Wait until all queued issue updates have been sent.
+
+        Raises RuntimeError if any update failed since the last drain.
         """
+        await self._update_queue.join()
+
+        if self._failed_updates:
+            failed, self._failed_updates = self._failed_updates, []
+            issue_ids = [issue_id for batch_ids, _ in failed for issue_id in batch_ids]
+            raise RuntimeError(
+                f"Failed to update {len(issue_ids)} issue(s): {', '.join(issue_ids)}"
+            ) from failed[0][1]
+
+    async def _process_updates(self):
+        """Send queued updates in batches of up to MAX_UPDATE_BATCH."""
+        while True:
+            queued = [await self._update_queue.get()]
+            while len(queued) < MAX_UPDATE_BATCH:
+                try:
+                    queued.append(self._update_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Each update goes through the client it was queued with, since
+            # a new agent client is created (and the old one closed) per session
+            batches: Dict[Any, List[Tuple[str, Optional[str], Dict]]] = {}
+            for agent_client, issue_id, project_id, fields in queued:
+                batches.setdefault(agent_client, []).append((issue_id, project_id, fields))
+
+            try:
+                for agent_client, batch in batches.items():
+                    try:
+                        await self._flush_updates(agent_client, batch)
+                    except Exception as e:
+                        print(f"⚠️  Failed to update {len(batch)} issues: {e}")
+                        self._failed_updates.append(([issue_id for issue_id, _, _ in batch], e))
+            finally:
+                for _ in queued:
+                    self._update_queue.task_done()
+
+    async def _flush_updates(self, agent_client, batch: List[Tuple[str, Optional[str], Dict]]):
+        """Send a batch of updates in one API call and invalidate session cache."""
         self.cache.track_api_call()
 
-        # After update, invalidate session cache
-        # self.cache.invalidate_session_cache(project_id)
+        # Placeholder for actual API call: one GraphQL request with an
+        # issueUpdate mutation per (issue_id, fields) entry in the batch
+
+        for project_id in {project_id for _, project_id, _ in batch if project_id}:
+            self.cache.invalidate_session_cache(project_id)
 
-        print(f"🔄 Issue updated, session cache invalidated")
+        print(f"🔄 {len(batch)} issue(s) updated, session cache invalidated")
 
     async def create_comment(self, agent_client, issue_id: str, body: str):
         """Create comment (always hits API, no caching)."""
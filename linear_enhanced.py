@@ -19,11 +19,86 @@ Based on Linear API research (December 2025):
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from types import MappingProxyType
+import heapq
 import json
+import os
 from linear_cache import LinearCache
 
+# orjson is much faster for large project histories; fall back to stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj).encode() + b'\n'
+
+    _loads = json.loads
+
+# Append-only history files (one JSON object per line) in the project dir.
+# Older projects kept these histories as lists inside .linear_project.json;
+# they are moved into these files the first time the project is loaded.
+HISTORY_FILES = {
+    'session_history': '.linear_session_history.jsonl',
+    'health_history': '.linear_health_history.jsonl',
+    'velocity_history': '.linear_velocity_history.jsonl',
+}
+
+# Labels for Linear priorities 1 (urgent) to 4 (low)
+_PRIORITY_LABELS = ('🔴 URGENT', '🟠 HIGH', '🟡 MEDIUM', '🟢 LOW')
+
+
+def read_jsonl_tail(path: Path, count: int = 1) -> List[Dict]:
+    """
+    Read the last `count` entries of a JSONL file (oldest first).
+
+    Reads backwards from the end of the file, so the cost does not grow
+    with the length of the history. Returns [] if the file does not exist.
+    """
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return []
+
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # count + 1 newlines guarantee the last `count` lines are complete
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    lines = [line for line in data.splitlines() if line.strip()]
+    return [_loads(line) for line in lines[-count:]]
+
+
+def read_history(project_dir: Path, project_data: Dict, name: str, count: int = 1) -> List[Dict]:
+    """
+    Get the last `count` entries of a project history (oldest first).
+
+    Falls back to the inline lists of projects created before histories
+    moved to JSONL files.
+    """
+    entries = read_jsonl_tail(project_dir / HISTORY_FILES[name], count)
+    if len(entries) < count:
+        legacy = project_data.get(name, [])
+        entries = legacy[-(count - len(entries)):] + entries
+    return entries
+
 
 class EnhancedLinearIntegration:
     """
@@ -37,8 +112,8 @@ class EnhancedLinearIntegration:
     - Label organization (functional, style, infrastructure, priority)
     """
 
-    # Milestone definitions for project phases
-    MILESTONES = {
+    # Milestone definitions for project phases (read-only)
+    MILESTONES = MappingProxyType({
         'setup': {
             'name': 'Project Setup',
             'description': 'Initial project scaffolding and infrastructure',
@@ -64,33 +139,68 @@ class EnhancedLinearIntegration:
             'description': 'All features implemented and tested',
             'target_percentage': 100
         }
-    }
+    })
+
+    # Milestones in order of target percentage
+    _MILESTONE_ORDER = tuple(sorted(MILESTONES.items(), key=lambda kv: kv[1]['target_percentage']))
 
-    # Label categories for organization
-    LABEL_CATEGORIES = {
-        'functional': ['auth', 'api', 'database', 'ui', 'testing'],
-        'style': ['layout', 'responsive', 'accessibility', 'animation'],
-        'infrastructure': ['build', 'deployment', 'monitoring', 'security'],
-        'priority': ['p1-urgent', 'p2-high', 'p3-medium', 'p4-low']
-    }
+    # Label categories for organization (read-only)
+    LABEL_CATEGORIES = MappingProxyType({
+        'functional': ('auth', 'api', 'database', 'ui', 'testing'),
+        'style': ('layout', 'responsive', 'accessibility', 'animation'),
+        'infrastructure': ('build', 'deployment', 'monitoring', 'security'),
+        'priority': ('p1-urgent', 'p2-high', 'p3-medium', 'p4-low')
+    })
+
+    __slots__ = ('project_dir', 'cache', 'project_file', 'project_data', '_progress_cache')
 
     def __init__(self, project_dir: Path, cache: Optional[LinearCache] = None):
         self.project_dir = project_dir
         self.cache = cache or LinearCache(project_dir)
         self.project_file = project_dir / ".linear_project.json"
         self.project_data = self._load_project_data()
+        # Last _scan_issues result: (issues list, its length, result)
+        self._progress_cache: Optional[Tuple[List[Dict], int, Tuple[int, int, List[Dict]]]] = None
 
     def _load_project_data(self) -> Dict:
         """Load project metadata from file."""
         if self.project_file.exists():
-            with open(self.project_file, 'r') as f:
-                return json.load(f)
+            data = _loads(self.project_file.read_bytes())
+            if any(name in data for name in HISTORY_FILES):
+                self._migrate_inline_histories(data)
+            return data
         return {}
 
+    def _migrate_inline_histories(self, data: Dict):
+        """
+        Move inline history lists of older projects into the history files.
+
+        Inline entries are older than anything already appended, so they go
+        first. History files are replaced before the project file is
+        rewritten: an interrupted migration can repeat entries, never lose them.
+        """
+        for name, filename in HISTORY_FILES.items():
+            legacy = data.get(name)
+            if not legacy:
+                continue
+
+            history_file = self.project_dir / filename
+            try:
+                appended = history_file.read_bytes()
+            except FileNotFoundError:
+                appended = b''
+
+            tmp_file = history_file.with_suffix('.jsonl.tmp')
+            tmp_file.write_bytes(b''.join(_dumps_line(entry) for entry in legacy) + appended)
+            os.replace(tmp_file, history_file)
+
+        for name in HISTORY_FILES:
+            data.pop(name, None)
+        self.project_file.write_bytes(_dumps(data))
+
     def _save_project_data(self):
         """Save project metadata to file."""
-        with open(self.project_file, 'w') as f:
-            json.dump(self.project_data, f, indent=2)
+        self.project_file.write_bytes(_dumps(self.project_data))
 
     def calculate_progress(self, issues: List[Dict]) -> Dict[str, Any]:
         """
@@ -111,8 +221,7 @@ class EnhancedLinearIntegration:
             }
         """
         total = len(issues)
-        completed = sum(1 for i in issues if i.get('state', {}).get('name') == 'Done')
-        in_progress = sum(1 for i in issues if i.get('state', {}).get('name') == 'In Progress')
+        completed, in_progress, _ = self._scan_issues(issues)
         todo = total - completed - in_progress
 
         # Calculate progress with Linear's formula
@@ -141,9 +250,38 @@ class EnhancedLinearIntegration:
             'estimated_completion': estimated_completion
         }
 
+    def _scan_issues(self, issues: List[Dict]) -> Tuple[int, int, List[Dict]]:
+        """
+        Count issues by state in a single pass.
+
+        Returns (completed, in_progress, todo_issues) where todo_issues are
+        the issues in the 'Todo' state.
+        """
+        completed = in_progress = 0
+        todo_issues = []
+        for issue in issues:
+            name = issue.get('state', {}).get('name')
+            if name == 'Done':
+                completed += 1
+            elif name == 'In Progress':
+                in_progress += 1
+            elif name == 'Todo':
+                todo_issues.append(issue)
+
+        result = (completed, in_progress, todo_issues)
+        self._progress_cache = (issues, len(issues), result)
+        return result
+
+    def _cached_scan_issues(self, issues: List[Dict]) -> Tuple[int, int, List[Dict]]:
+        """Reuse the last _scan_issues result if it was for this same list."""
+        cached = self._progress_cache
+        if cached and cached[0] is issues and cached[1] == len(issues):
+            return cached[2]
+        return self._scan_issues(issues)
+
     def determine_current_milestone(self, progress_percentage: float) -> Dict[str, str]:
         """Determine current milestone based on progress."""
-        for key, milestone in self.MILESTONES.items():
+        for key, milestone in self._MILESTONE_ORDER:
             if progress_percentage < milestone['target_percentage']:
                 return {
                     'key': key,
@@ -196,12 +334,12 @@ class EnhancedLinearIntegration:
         Returns formatted markdown for Linear comment.
         """
         progress = self.calculate_progress(all_issues)
-        milestone = self.determine_current_milestone(progress['progress_percentage'])
-        health = self.determine_health_status(
-            progress['progress_percentage'],
-            progress['velocity'],
-            session_metrics.get('errors', 0)
-        )
+        progress_percentage = progress['progress_percentage']
+        velocity = progress['velocity']
+        errors = session_metrics.get('errors', 0)
+
+        milestone = self.determine_current_milestone(progress_percentage)
+        health = self.determine_health_status(progress_percentage, velocity, errors)
 
         # Health emoji
         health_emoji = {
@@ -210,16 +348,18 @@ class EnhancedLinearIntegration:
             'off_track': '🔴'
         }.get(health, '⚪')
 
+        completed_block = '\n'.join(['- ' + title for title in issues_completed]) or '- No issues completed'
+
         summary = f"""## Session Complete - {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 ### Issues Completed This Session
-{chr(10).join(f'- {title}' for title in issues_completed) if issues_completed else '- No issues completed'}
+{completed_block}
 
 ### Progress Overview
-- **Total Progress**: {progress['progress_percentage']}% complete
+- **Total Progress**: {progress_percentage}% complete
 - **Issues**: {progress['completed']}/{progress['total_issues']} done, {progress['in_progress']} in progress, {progress['todo']} remaining
 - **Current Milestone**: {milestone['name']} (Target: {milestone['target']}%)
-- **Velocity**: {progress['velocity']} issues/session
+- **Velocity**: {velocity} issues/session
 - **Estimated Completion**: {progress['estimated_completion']}
 
 ### Health Status
@@ -228,7 +368,7 @@ class EnhancedLinearIntegration:
 ### Session Metrics
 - **Linear API Calls**: {session_metrics.get('linear_api_calls', 0)} (Cached: {session_metrics.get('linear_api_cached', 0)})
 - **Tools Used**: {len(session_metrics.get('tools_used', {}))} unique tools
-- **Errors**: {session_metrics.get('errors', 0)}
+- **Errors**: {errors}
 - **Session Duration**: {session_metrics.get('duration_minutes', 'N/A')} minutes
 
 ### Next Session Priorities
@@ -246,17 +386,16 @@ class EnhancedLinearIntegration:
     ) -> str:
         """Generate priority recommendations for next session."""
         # Find highest priority Todo issues
-        todo_issues = [i for i in all_issues if i.get('state', {}).get('name') == 'Todo']
-        todo_issues.sort(key=lambda x: x.get('priority', 4))
-
-        top_3 = todo_issues[:3]
+        # Usually already scanned by calculate_progress in generate_session_summary
+        _, _, todo_issues = self._cached_scan_issues(all_issues)
+        top_3 = heapq.nsmallest(3, todo_issues, key=lambda x: x.get('priority', 4))
         if not top_3:
             return "🎉 All issues completed!"
 
         priorities = []
         for issue in top_3:
             priority = issue.get('priority', 4)
-            priority_label = ['🔴 URGENT', '🟠 HIGH', '🟡 MEDIUM', '🟢 LOW'][priority - 1]
+            priority_label = _PRIORITY_LABELS[priority - 1]
             title = issue.get('title', 'Unknown')
             priorities.append(f"- {priority_label}: {title}")
 
@@ -284,41 +423,53 @@ class EnhancedLinearIntegration:
             'issues_by_priority': issues_by_priority,
             'milestones_created': milestones_created,
             'session_count': 0,
-            'milestones': self.MILESTONES,
-            'health_history': [],
-            'velocity_history': []
+            'milestones': dict(self.MILESTONES)
         }
 
     def update_session_history(self, session_summary: Dict):
-        """Update session history in project data."""
-        if 'session_history' not in self.project_data:
-            self.project_data['session_history'] = []
+        """
+        Record a session in the project histories.
 
-        self.project_data['session_history'].append(session_summary)
-        self.project_data['session_count'] = len(self.project_data['session_history'])
+        Each history gets one appended line; only the session count is
+        rewritten in the project file.
+        """
+        timestamp = datetime.now().isoformat()
+        self._append_history('session_history', session_summary)
 
         # Track health history
-        if 'health_history' not in self.project_data:
-            self.project_data['health_history'] = []
-
-        self.project_data['health_history'].append({
-            'timestamp': datetime.now().isoformat(),
+        self._append_history('health_history', {
+            'timestamp': timestamp,
             'health': session_summary.get('health', 'unknown'),
             'progress': session_summary.get('progress_percentage', 0)
         })
 
         # Track velocity history
-        if 'velocity_history' not in self.project_data:
-            self.project_data['velocity_history'] = []
-
-        self.project_data['velocity_history'].append({
-            'timestamp': datetime.now().isoformat(),
+        self._append_history('velocity_history', {
+            'timestamp': timestamp,
             'velocity': session_summary.get('velocity', 0),
             'issues_completed': session_summary.get('issues_completed', 0)
         })
 
+        self.project_data['session_count'] = self.project_data.get('session_count', 0) + 1
         self._save_project_data()
 
+    def _append_history(self, name: str, entry: Dict):
+        """
+        Append one entry to a history file.
+
+        Uses a single write() on an O_APPEND descriptor, so concurrent
+        writers (e.g. parallel agents) never interleave partial lines.
+        """
+        fd = os.open(
+            self.project_dir / HISTORY_FILES[name],
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644
+        )
+        try:
+            os.write(fd, _dumps_line(entry))
+        finally:
+            os.close(fd)
+
     def generate_progress_report(self) -> str:
         """
         Generate comprehensive progress report for terminal output.
@@ -329,10 +480,12 @@ class EnhancedLinearIntegration:
             return "⚠️  Project not initialized"
 
         sessions = self.project_data.get('session_count', 0)
-        latest_health = self.project_data.get('health_history', [])[-1] if self.project_data.get('health_history') else None
-        latest_velocity = self.project_data.get('velocity_history', [])[-1] if self.project_data.get('velocity_history') else None
+        health_history = read_history(self.project_dir, self.project_data, 'health_history')
+        velocity_history = read_history(self.project_dir, self.project_data, 'velocity_history')
+        latest_health = health_history[-1] if health_history else None
+        latest_velocity = velocity_history[-1] if velocity_history else None
 
-        report = f"""
+        parts = [f"""
 ╔════════════════════════════════════════════════════════════════╗
 ║         LINEAR CODING AGENT - PROGRESS REPORT                 ║
 ╚════════════════════════════════════════════════════════════════╝
@@ -341,25 +494,25 @@ Project: {self.project_data.get('project_name', 'Unknown')}
 Sessions Completed: {sessions}
 Total Issues: {self.project_data.get('total_issues', 0)}
 
-"""
+"""]
         if latest_health:
             health_emoji = {'on_track': '🟢', 'at_risk': '🟡', 'off_track': '🔴'}.get(latest_health.get('health', ''), '⚪')
-            report += f"Current Health: {health_emoji} {latest_health.get('health', 'unknown').replace('_', ' ').title()}\n"
-            report += f"Progress: {latest_health.get('progress', 0)}%\n"
+            parts.append(f"Current Health: {health_emoji} {latest_health.get('health', 'unknown').replace('_', ' ').title()}\n")
+            parts.append(f"Progress: {latest_health.get('progress', 0)}%\n")
 
         if latest_velocity:
-            report += f"Current Velocity: {latest_velocity.get('velocity', 0)} issues/session\n"
+            parts.append(f"Current Velocity: {latest_velocity.get('velocity', 0)} issues/session\n")
 
-        report += f"\nLog Files:\n"
+        parts.append("\nLog Files:\n")
         log_dir = self.project_dir / "logs"
         if log_dir.exists():
-            report += f"  - Daily: {log_dir / 'agent_daily.log'}\n"
-            report += f"  - Errors: {log_dir / 'errors.log'}\n"
+            parts.append(f"  - Daily: {log_dir / 'agent_daily.log'}\n")
+            parts.append(f"  - Errors: {log_dir / 'errors.log'}\n")
 
-        report += f"\nLinear Project: {self.project_data.get('project_url', 'N/A')}\n"
-        report += f"Cache: {self.project_dir / '.linear_cache.json'}\n"
+        parts.append(f"\nLinear Project: {self.project_data.get('project_url', 'N/A')}\n")
+        parts.append(f"Cache: {self.project_dir / '.linear_cache.json'}\n")
 
-        return report
+        return "".join(parts)
 
 
 def create_enhanced_integration(
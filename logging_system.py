@@ -30,6 +30,11 @@ from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 import sys
 
 
+# Write buffer per session/daily log file. Buffers are also flushed on ERROR
+# records, at session end, and when the handler is closed at interpreter exit.
+LOG_BUFFER_BYTES = 64 * 1024
+
+
 class StructuredLogger:
     """
     Structured logging system with JSON output and multiple handlers.
@@ -84,14 +89,14 @@ class StructuredLogger:
 
         # 1. Session-specific JSON log file (detailed)
         session_log_file = self.log_dir / f"session_{self.session_id}.jsonl"
-        session_handler = logging.FileHandler(session_log_file, mode='a')
+        session_handler = BufferedFileHandler(session_log_file, mode='a')
         session_handler.setLevel(logging.DEBUG)
         session_handler.setFormatter(StructuredFormatter(self.session_id, self.agent_type))
         logger.addHandler(session_handler)
 
         # 2. Daily rotating log file (all sessions)
         daily_log_file = self.log_dir / "agent_daily.log"
-        daily_handler = TimedRotatingFileHandler(
+        daily_handler = BufferedTimedRotatingFileHandler(
             daily_log_file,
             when='midnight',
             interval=1,
@@ -101,7 +106,7 @@ class StructuredLogger:
         daily_handler.setFormatter(StructuredFormatter(self.session_id, self.agent_type))
         logger.addHandler(daily_handler)
 
-        # 3. Error log file (errors only, size-based rotation)
+        # 3. Error log file (errors only, size-based rotation, unbuffered)
         error_log_file = self.log_dir / "errors.log"
         error_handler = RotatingFileHandler(
             error_log_file,
@@ -120,6 +125,21 @@ class StructuredLogger:
 
         return logger
 
+    def flush(self):
+        """Write out any buffered log records."""
+        for handler in self.logger.handlers:
+            if isinstance(handler, _BufferedStreamMixin):
+                handler.flush_buffer()
+            else:
+                handler.flush()
+
+    def _close_buffered_handlers(self):
+        """Close the session and daily file handlers, freeing their buffers."""
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, _BufferedStreamMixin):
+                self.logger.removeHandler(handler)
+                handler.close()
+
     def start_timer(self, operation: str):
         """Start timing an operation."""
         self.timers[operation] = time.time()
@@ -242,6 +262,7 @@ class StructuredLogger:
             },
             exc_info=True
         )
+        self.flush()
 
     def log_session_start(self):
         """Log session start."""
@@ -255,7 +276,12 @@ class StructuredLogger:
         )
 
     def log_session_end(self, issues_completed: int, issues_attempted: int):
-        """Log session end with summary."""
+        """
+        Log session end with summary.
+
+        Closes the session and daily log files; later records only go to
+        the error log and console.
+        """
         self.metrics['session_end'] = datetime.now().isoformat()
 
         self.logger.info(
@@ -268,6 +294,10 @@ class StructuredLogger:
                 'metrics': self.metrics
             }
         )
+        self.flush()
+
+        # A new logger (with new file handlers) is created for every session
+        self._close_buffered_handlers()
 
     def get_session_summary(self) -> Dict[str, Any]:
         """Get session metrics summary."""
@@ -283,6 +313,50 @@ class StructuredLogger:
         }
 
 
+class _BufferedStreamMixin:
+    """
+    File handler mixin that writes through a LOG_BUFFER_BYTES buffer.
+
+    StreamHandler flushes after every record, which is one write syscall
+    per log line; here that flush is a no-op and the buffer is written when
+    full, on ERROR records, on flush_buffer() and on close.
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_BUFFER_BYTES,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
+    def flush(self):
+        """Skip the per-record flush; see flush_buffer()."""
+
+    def flush_buffer(self):
+        """Write buffered records to the log file."""
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+
+
+class BufferedFileHandler(_BufferedStreamMixin, logging.FileHandler):
+    """FileHandler with a large write buffer."""
+
+
+class BufferedTimedRotatingFileHandler(_BufferedStreamMixin, TimedRotatingFileHandler):
+    """TimedRotatingFileHandler with a large write buffer."""
+
+
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
@@ -25,6 +25,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import sys
 
+from linear_enhanced import read_history
+
 
 class ProgressMonitor:
     """Monitor and display agent progress."""
@@ -34,22 +36,36 @@ class ProgressMonitor:
         self.project_file = project_dir / ".linear_project.json"
         self.cache_file = project_dir / ".linear_cache.json"
         self.log_dir = project_dir / "logs"
+        # Last parse per file: path -> ((mtime_ns, size), data)
+        self._parsed: Dict[Path, tuple] = {}
+
+    def _load_json(self, path: Path) -> Optional[Dict]:
+        """
+        Load a JSON file, reusing the previous parse while it is unchanged.
+        Watch mode redraws often, but the project and cache files rarely change.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        # Read as bytes: orjson writes raw UTF-8, not the locale encoding
+        data = json.loads(path.read_bytes())
+        self._parsed[path] = (key, data)
+        return data
 
     def load_project_data(self) -> Optional[Dict]:
         """Load project metadata."""
-        if not self.project_file.exists():
-            return None
-
-        with open(self.project_file, 'r') as f:
-            return json.load(f)
+        return self._load_json(self.project_file)
 
     def load_cache_data(self) -> Optional[Dict]:
         """Load cache data."""
-        if not self.cache_file.exists():
-            return None
-
-        with open(self.cache_file, 'r') as f:
-            return json.load(f)
+        return self._load_json(self.cache_file)
 
     def count_log_lines(self) -> Dict[str, int]:
         """Count lines in log files."""
@@ -169,8 +185,9 @@ class ProgressMonitor:
                 dashboard += f"\n  🔗 Linear: {project_data['project_url']}\n"
 
         # Progress Metrics
-        if project_data and 'health_history' in project_data:
-            latest_health = project_data['health_history'][-1] if project_data['health_history'] else None
+        if project_data:
+            health_history = read_history(self.project_dir, project_data, 'health_history')
+            latest_health = health_history[-1] if health_history else None
 
             if latest_health:
                 dashboard += """
@@ -199,10 +216,10 @@ class ProgressMonitor:
                 dashboard += f"  [{bar}] {progress}%\n"
 
         # Velocity Trends
-        if project_data and 'velocity_history' in project_data:
-            velocity_history = project_data['velocity_history']
+        if project_data:
+            velocity_history = read_history(self.project_dir, project_data, 'velocity_history', count=5)
             if len(velocity_history) >= 3:
-                recent_velocity = [v['velocity'] for v in velocity_history[-5:]]
+                recent_velocity = [v['velocity'] for v in velocity_history]
                 avg_velocity = sum(recent_velocity) / len(recent_velocity)
 
                 dashboard += f"\n  Velocity: {avg_velocity:.2f} issues/session (avg last 5)\n"
@@ -187,9 +187,8 @@ async def run_parallel_demo(project_dir: Path, num_agents: int = 3):
         print("❌ Error: Project not initialized. Run initializer first.")
         return
 
-    with open(project_json, 'r') as f:
-        project_data = json.load(f)
-        project_id = project_data['project_id']
+    project_data = json.loads(project_json.read_bytes())
+    project_id = project_data['project_id']
 
     # Run parallel agents
     results = await coordinator.run_parallel_agents(project_id, num_agents=num_agents)
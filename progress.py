@@ -28,9 +28,9 @@ def load_linear_project_state(project_dir: Path) -> dict | None:
         return None
 
     try:
-        with open(marker_file, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        # Read as bytes: the file is UTF-8 whatever the locale encoding
+        return json.loads(marker_file.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         return None
 
 
@@ -6,6 +6,7 @@ Functions for loading prompt templates from the prompts directory.
 """
 
 import shutil
+from functools import cache
 from pathlib import Path
 
 
@@ -18,13 +19,15 @@ def load_prompt(name: str) -> str:
     return prompt_path.read_text()
 
 
+@cache
 def get_initializer_prompt() -> str:
-    """Load the initializer prompt."""
+    """Load the initializer prompt (read once per process)."""
     return load_prompt("initializer_prompt")
 
 
+@cache
 def get_coding_prompt() -> str:
-    """Load the coding agent prompt."""
+    """Load the coding agent prompt (read once per process)."""
     return load_prompt("coding_prompt")
 
 
@@ -18,20 +18,54 @@ Use Cases:
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 import json
-from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
 import os
 
-# Load environment variables
+if TYPE_CHECKING:
+    from claude_code_sdk import ClaudeSDKClient
+
+# The SDK and dotenv are imported when a client is created, so importing
+# this module for its tool lists stays cheap
+_dotenv_loaded = False
+
+
+def _load_env():
+    """Load environment variables from .env once."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+
+# Use orjson for writing settings files when available
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    pass
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def _write_if_changed(path: Path, payload: bytes):
+    """Write payload to path unless the file already holds exactly that content."""
+    try:
+        if path.read_bytes() == payload:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(payload)
 
 
 # All MCP tools (no restrictions)
-PUPPETEER_TOOLS = [
+PUPPETEER_TOOLS = (
     "mcp__puppeteer__puppeteer_navigate",
     "mcp__puppeteer__puppeteer_screenshot",
     "mcp__puppeteer__puppeteer_click",
@@ -39,9 +73,9 @@ PUPPETEER_TOOLS = [
     "mcp__puppeteer__puppeteer_select",
     "mcp__puppeteer__puppeteer_hover",
     "mcp__puppeteer__puppeteer_evaluate",
-]
+)
 
-LINEAR_TOOLS = [
+LINEAR_TOOLS = (
     "mcp__linear__list_teams",
     "mcp__linear__get_team",
     "mcp__linear__list_projects",
@@ -60,32 +94,37 @@ LINEAR_TOOLS = [
     "mcp__linear__list_issue_labels",
     "mcp__linear__list_users",
     "mcp__linear__get_user",
-]
+)
 
-BUILTIN_TOOLS = [
+BUILTIN_TOOLS = (
     "Read",
     "Write",
     "Edit",
     "Glob",
     "Grep",
     "Bash",
-]
+)
 
 
-def create_yolo_client(project_dir: Path, model: str) -> ClaudeSDKClient:
+def _create_client(
+    project_dir: Path,
+    model: str,
+    *,
+    sandbox: dict,
+    settings_name: str,
+    system_prompt: str,
+    banner_title: str,
+    banner_lines: tuple,
+) -> "ClaudeSDKClient":
     """
-    Create a Claude Agent SDK client with MINIMAL security restrictions.
-
-    ⚠️  WARNING: This bypasses security hooks and allows all commands!
-    Only use in trusted/sandboxed environments.
-
-    Args:
-        project_dir: Directory for the project
-        model: Claude model to use
+    Create a Claude Agent SDK client with all commands and tools allowed.
 
-    Returns:
-        Configured ClaudeSDKClient with YOLO mode
+    The YOLO modes differ only in sandboxing, settings file name, system
+    prompt and the startup banner.
     """
+    from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
+
+    _load_env()
     api_key = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
     if not api_key:
         raise ValueError(
@@ -100,14 +139,9 @@ def create_yolo_client(project_dir: Path, model: str) -> ClaudeSDKClient:
             "Get your API key from: https://linear.app/YOUR-TEAM/settings/api"
         )
 
-    # YOLO security settings - minimal restrictions
-    # Note: Sandbox can still be enabled for filesystem isolation
-    # but we remove the allowlist restrictions
+    # Minimal restrictions: no command allowlist, everything auto-approved
     security_settings = {
-        "sandbox": {
-            "enabled": True,  # Still isolate bash, but no command restrictions
-            "autoAllowBashIfSandboxed": True
-        },
+        "sandbox": sandbox,
         "permissions": {
             "defaultMode": "accept",  # Auto-approve everything
             "allow": [
@@ -127,26 +161,22 @@ def create_yolo_client(project_dir: Path, model: str) -> ClaudeSDKClient:
 
     # Ensure project directory exists
     project_dir.mkdir(parents=True, exist_ok=True)
+    resolved_dir = project_dir.resolve()
 
     # Write settings to file
-    settings_file = project_dir / ".claude_settings_yolo.json"
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
+    settings_file = project_dir / settings_name
+    _write_if_changed(settings_file, _dumps(security_settings))
 
-    print("🚀 YOLO MODE ENABLED - Security restrictions minimized!")
+    print(banner_title)
     print(f"   - Settings: {settings_file}")
-    print(f"   - Sandbox: Enabled (filesystem isolation only)")
-    print(f"   - Bash: All commands allowed")
-    print(f"   - File ops: Unrestricted")
-    print("   ⚠️  WARNING: Use only in trusted environments!")
+    for line in banner_lines:
+        print(line)
     print()
 
     return ClaudeSDKClient(
         options=ClaudeCodeOptions(
             model=model,
-            system_prompt="""You are an expert full-stack developer with maximum autonomy.
-You have unrestricted access to all development tools and commands.
-Use Linear for project management and tracking. Build production-quality applications.""",
+            system_prompt=system_prompt,
             allowed_tools=[
                 *BUILTIN_TOOLS,
                 *PUPPETEER_TOOLS,
@@ -165,13 +195,50 @@ Use Linear for project management and tracking. Build production-quality applica
             # NO security hooks - all commands allowed
             hooks={},
             max_turns=1000,
-            cwd=str(project_dir.resolve()),
-            settings=str(settings_file.resolve()),
+            cwd=str(resolved_dir),
+            settings=str(resolved_dir / settings_name),
         )
     )
 
 
-def create_ultra_yolo_client(project_dir: Path, model: str) -> ClaudeSDKClient:
+def create_yolo_client(project_dir: Path, model: str) -> "ClaudeSDKClient":
+    """
+    Create a Claude Agent SDK client with MINIMAL security restrictions.
+
+    ⚠️  WARNING: This bypasses security hooks and allows all commands!
+    Only use in trusted/sandboxed environments.
+
+    Args:
+        project_dir: Directory for the project
+        model: Claude model to use
+
+    Returns:
+        Configured ClaudeSDKClient with YOLO mode
+    """
+    return _create_client(
+        project_dir,
+        model,
+        # Sandbox still isolates bash for filesystem isolation, but without
+        # any command restrictions
+        sandbox={
+            "enabled": True,
+            "autoAllowBashIfSandboxed": True
+        },
+        settings_name=".claude_settings_yolo.json",
+        system_prompt="""You are an expert full-stack developer with maximum autonomy.
+You have unrestricted access to all development tools and commands.
+Use Linear for project management and tracking. Build production-quality applications.""",
+        banner_title="🚀 YOLO MODE ENABLED - Security restrictions minimized!",
+        banner_lines=(
+            "   - Sandbox: Enabled (filesystem isolation only)",
+            "   - Bash: All commands allowed",
+            "   - File ops: Unrestricted",
+            "   ⚠️  WARNING: Use only in trusted environments!",
+        ),
+    )
+
+
+def create_ultra_yolo_client(project_dir: Path, model: str) -> "ClaudeSDKClient":
     """
     Create a Claude Agent SDK client with ZERO restrictions.
 
@@ -185,70 +252,21 @@ def create_ultra_yolo_client(project_dir: Path, model: str) -> ClaudeSDKClient:
     Returns:
         Configured ClaudeSDKClient with ultra-YOLO mode
     """
-    api_key = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
-    if not api_key:
-        raise ValueError("CLAUDE_CODE_OAUTH_TOKEN environment variable not set.")
-
-    linear_api_key = os.environ.get("LINEAR_API_KEY")
-    if not linear_api_key:
-        raise ValueError("LINEAR_API_KEY environment variable not set.")
-
-    # ULTRA YOLO - No sandbox, no restrictions
-    security_settings = {
-        "sandbox": {
+    return _create_client(
+        project_dir,
+        model,
+        sandbox={
             "enabled": False,  # DISABLED - No sandbox isolation
         },
-        "permissions": {
-            "defaultMode": "accept",
-            "allow": [
-                "Read(**)",
-                "Write(**)",
-                "Edit(**)",
-                "Glob(**)",
-                "Grep(**)",
-                "Bash(*)",
-                *PUPPETEER_TOOLS,
-                *LINEAR_TOOLS,
-            ],
-        },
-    }
-
-    project_dir.mkdir(parents=True, exist_ok=True)
-    settings_file = project_dir / ".claude_settings_ultra_yolo.json"
-
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
-
-    print("💀 ULTRA YOLO MODE - ALL RESTRICTIONS DISABLED!")
-    print(f"   - Settings: {settings_file}")
-    print(f"   - Sandbox: DISABLED")
-    print(f"   - Bash: Unrestricted system access")
-    print(f"   - File ops: Full filesystem access")
-    print("   ⚠️  DANGER: Agent has full system access!")
-    print()
-
-    return ClaudeSDKClient(
-        options=ClaudeCodeOptions(
-            model=model,
-            system_prompt="""You are an expert full-stack developer with complete system access.
+        settings_name=".claude_settings_ultra_yolo.json",
+        system_prompt="""You are an expert full-stack developer with complete system access.
 You have unrestricted access to all commands and system operations.
 Use Linear for project management. Build production-quality applications with maximum freedom.""",
-            allowed_tools=[
-                *BUILTIN_TOOLS,
-                *PUPPETEER_TOOLS,
-                *LINEAR_TOOLS,
-            ],
-            mcp_servers={
-                "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
-                "linear": {
-                    "type": "http",
-                    "url": "https://mcp.linear.app/mcp",
-                    "headers": {"Authorization": f"Bearer {linear_api_key}"}
-                }
-            },
-            hooks={},
-            max_turns=1000,
-            cwd=str(project_dir.resolve()),
-            settings=str(settings_file.resolve()),
-        )
+        banner_title="💀 ULTRA YOLO MODE - ALL RESTRICTIONS DISABLED!",
+        banner_lines=(
+            "   - Sandbox: DISABLED",
+            "   - Bash: Unrestricted system access",
+            "   - File ops: Full filesystem access",
+            "   ⚠️  DANGER: Agent has full system access!",
+        ),
     )
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+History File Tests
+==================
+
+Tests for the append-only JSONL project histories: reading them, and
+migrating the inline histories of older project files.
+Run with: python test_history.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from linear_enhanced import (
+    HISTORY_FILES,
+    EnhancedLinearIntegration,
+    read_history,
+    read_jsonl_tail,
+)
+from monitor import ProgressMonitor
+
+
+def check(name: str, actual, expected) -> bool:
+    """Compare a result against its expected value and print the outcome."""
+    if actual == expected:
+        print(f"  PASS: {name}")
+        return True
+
+    print(f"  FAIL: {name}")
+    print(f"         Expected: {expected!r}")
+    print(f"         Got: {actual!r}")
+    return False
+
+
+def write_lines(path: Path, entries, trailing_newline: bool = True):
+    """Write entries as JSONL, optionally without the final newline."""
+    text = "\n".join(json.dumps(entry) for entry in entries)
+    if trailing_newline:
+        text += "\n"
+    path.write_text(text)
+
+
+def read_lines(path: Path):
+    """Read all entries of a JSONL file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_read_jsonl_tail(tmp_dir: Path):
+    """Test reading the last entries of a JSONL file."""
+    print("\nTesting read_jsonl_tail:\n")
+    passed = 0
+    failed = 0
+
+    entries = [{"n": i} for i in range(10)]
+    history = tmp_dir / "history.jsonl"
+
+    write_lines(history, entries)
+    results = [
+        check("last entry", read_jsonl_tail(history), entries[-1:]),
+        check("last 3 entries", read_jsonl_tail(history, 3), entries[-3:]),
+        check("count larger than file", read_jsonl_tail(history, 50), entries),
+        check("missing file", read_jsonl_tail(tmp_dir / "missing.jsonl", 5), []),
+    ]
+
+    write_lines(history, entries, trailing_newline=False)
+    results += [
+        check("no trailing newline, last entry", read_jsonl_tail(history), entries[-1:]),
+        check("no trailing newline, last 3 entries", read_jsonl_tail(history, 3), entries[-3:]),
+        check("no trailing newline, count larger than file", read_jsonl_tail(history, 50), entries),
+    ]
+
+    # Lines spanning several 4096-byte read blocks
+    long_entries = [{"n": i, "text": str(i) * 10000} for i in range(4)]
+    write_lines(history, long_entries)
+    results += [
+        check("long lines, last entry", read_jsonl_tail(history), long_entries[-1:]),
+        check("long lines, last 2 entries", read_jsonl_tail(history, 2), long_entries[-2:]),
+        check("long lines, count larger than file", read_jsonl_tail(history, 10), long_entries),
+    ]
+
+    history.write_text("")
+    results.append(check("empty file", read_jsonl_tail(history, 3), []))
+
+    for result in results:
+        if result:
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def test_read_history(tmp_dir: Path):
+    """Test merging history files with inline lists of older projects."""
+    print("\nTesting read_history:\n")
+    passed = 0
+    failed = 0
+
+    inline = [{"n": i} for i in range(5)]
+    appended = [{"n": i} for i in range(5, 8)]
+    project_data = {"health_history": inline}
+    write_lines(tmp_dir / HISTORY_FILES["health_history"], appended)
+
+    results = [
+        check("file only", read_history(tmp_dir, project_data, "health_history", 2), appended[-2:]),
+        check("file and inline list",
+              read_history(tmp_dir, project_data, "health_history", 5), inline[-2:] + appended),
+        check("count larger than both",
+              read_history(tmp_dir, project_data, "health_history", 20), inline + appended),
+        check("inline list only",
+              read_history(tmp_dir, {"velocity_history": inline}, "velocity_history", 3), inline[-3:]),
+        check("no history", read_history(tmp_dir, {}, "session_history", 3), []),
+    ]
+
+    for result in results:
+        if result:
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def test_migrate_inline_histories(tmp_dir: Path):
+    """Test moving inline histories of an older project into history files."""
+    print("\nTesting inline history migration:\n")
+    passed = 0
+    failed = 0
+
+    # Older project file with inline lists, plus one line already appended
+    inline = {name: [{"name": name, "n": i} for i in range(3)] for name in HISTORY_FILES}
+    appended = {"name": "health_history", "n": 3}
+    (tmp_dir / ".linear_project.json").write_text(json.dumps({
+        "project_name": "test",
+        "session_count": 3,
+        **inline,
+    }))
+    write_lines(tmp_dir / HISTORY_FILES["health_history"], [appended])
+
+    integration = EnhancedLinearIntegration(tmp_dir)
+    project_data = json.loads((tmp_dir / ".linear_project.json").read_text())
+
+    results = [
+        check("session history migrated",
+              read_lines(tmp_dir / HISTORY_FILES["session_history"]), inline["session_history"]),
+        check("inline entries before appended ones",
+              read_lines(tmp_dir / HISTORY_FILES["health_history"]),
+              inline["health_history"] + [appended]),
+        check("velocity history migrated",
+              read_lines(tmp_dir / HISTORY_FILES["velocity_history"]), inline["velocity_history"]),
+        check("history keys removed from project file",
+              [name for name in HISTORY_FILES if name in project_data], []),
+        check("session count kept", project_data.get("session_count"), 3),
+    ]
+
+    integration.update_session_history({"session": 4, "health": "on_track", "velocity": 1.5})
+    session_lines = read_lines(tmp_dir / HISTORY_FILES["session_history"])
+    velocity_lines = read_lines(tmp_dir / HISTORY_FILES["velocity_history"])
+    results += [
+        check("new session appended after migrated entries",
+              session_lines, inline["session_history"] + [{"session": 4, "health": "on_track", "velocity": 1.5}]),
+        check("new velocity appended after migrated entries",
+              (velocity_lines[:3], velocity_lines[3]["velocity"]), (inline["velocity_history"], 1.5)),
+        check("session count incremented",
+              json.loads((tmp_dir / ".linear_project.json").read_text()).get("session_count"), 4),
+    ]
+
+    for result in results:
+        if result:
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def test_monitor_velocity(tmp_dir: Path):
+    """Test the monitor's velocity average over the last 5 sessions."""
+    print("\nTesting monitor velocity average:\n")
+    passed = 0
+    failed = 0
+
+    # 4 inline entries (older project) followed by 3 appended ones; the
+    # average covers the last 2 inline and all 3 appended velocities
+    inline = [{"velocity": v} for v in (9.0, 9.0, 1.0, 2.0)]
+    appended = [{"velocity": v} for v in (3.0, 4.0, 5.0)]
+    (tmp_dir / ".linear_project.json").write_text(json.dumps({
+        "project_name": "test",
+        "velocity_history": inline,
+    }))
+    write_lines(tmp_dir / HISTORY_FILES["velocity_history"], appended)
+
+    dashboard = ProgressMonitor(tmp_dir).generate_dashboard()
+    line = next((l.strip() for l in dashboard.splitlines() if "Velocity:" in l), None)
+
+    if check("average of last 5", line, "Velocity: 3.00 issues/session (avg last 5)"):
+        passed += 1
+    else:
+        failed += 1
+
+    return passed, failed
+
+
+def main():
+    print("=" * 70)
+    print("  HISTORY FILE TESTS")
+    print("=" * 70)
+
+    passed = 0
+    failed = 0
+
+    tests = (
+        test_read_jsonl_tail,
+        test_read_history,
+        test_migrate_inline_histories,
+        test_monitor_velocity,
+    )
+    for test in tests:
+        with tempfile.TemporaryDirectory() as tmp:
+            test_passed, test_failed = test(Path(tmp))
+        passed += test_passed
+        failed += test_failed
+
+    # Summary
+    print("\n" + "-" * 70)
+    print(f"  Results: {passed} passed, {failed} failed")
+    print("-" * 70)
+
+    if failed == 0:
+        print("\n  ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n  {failed} TEST(S) FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())